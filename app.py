@@ -1,9 +1,13 @@
 import os
+import hashlib
 import pandas as pd
 import plotly.graph_objects as go
 import dash
 from dash import dcc, html
 from dash.dependencies import Input, Output
+from dash.fingerprint import check_fingerprint
+from flask import request
+from flask_compress import Compress
 
 # File paths
 ohlc_file = "Fortnightly_Sector_Indices.csv"
@@ -35,10 +39,71 @@ merged_df["Net FPI Change"] = merged_df["Net FPI Change"].fillna(0)
 # Get unique sectors
 sectors = sorted(merged_df["sector"].dropna().unique())
 
+# Split the data per sector once, sorted by date, so callbacks only slice a
+# prepared frame. Nothing modifies these after startup, which keeps them safe
+# to share between gunicorn threads (and between workers with preload_app).
+sector_frames = {
+    sector: frame.sort_values("date").reset_index(drop=True)
+    for sector, frame in merged_df.groupby("sector")
+}
+
 # Initialize Dash App
 app = dash.Dash(__name__)
 server = app.server  # Expose Flask server for Gunicorn
 
+# Compress callback responses (the candlestick figure JSON) and HTML/JS/CSS.
+# Brotli is preferred when the browser supports it, gzip otherwise; small
+# responses are sent as-is since compressing them costs more than it saves.
+server.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+server.config["COMPRESS_MIN_SIZE"] = int(os.environ.get("COMPRESS_MIN_SIZE", 1024))
+server.config["COMPRESS_LEVEL"] = 6
+server.config["COMPRESS_BR_LEVEL"] = 4
+server.config["COMPRESS_MIMETYPES"] = [
+    "application/json",
+    "application/javascript",
+    "text/javascript",
+    "text/html",
+    "text/css",
+]
+Compress(server)
+
+# Requests whose response only changes on redeploy; revalidated with an ETag
+LAYOUT_PATHS = ("_dash-layout", "_dash-dependencies")
+ONE_YEAR = 31536000
+
+
+@server.after_request
+def set_cache_headers(response):
+    """Add caching headers to static assets and the app layout"""
+    path = request.path
+    if response.status_code != 200 or request.method != "GET":
+        return response
+
+    # Versioned static files: Dash fingerprints component bundles
+    # (dash_core_components.v2_14_0m1700000000.js) and appends ?m=<mtime> to
+    # files from the assets folder, so a new version always gets a new URL.
+    prefix = app.config.routes_pathname_prefix
+    assets_prefix = prefix + app.config.assets_url_path.lstrip("/") + "/"
+    fingerprinted = path.startswith(prefix + "_dash-component-suites/") and check_fingerprint(path)[1]
+    if fingerprinted or (path.startswith(assets_prefix) and "m" in request.args):
+        response.cache_control.public = True
+        response.cache_control.max_age = ONE_YEAR
+        response.cache_control.immutable = True
+        return response
+
+    if path.endswith(LAYOUT_PATHS):
+        etag = hashlib.md5(response.get_data()).hexdigest()
+        # Flask-Compress appends ":br"/":gzip" to the ETag it sends, so strip
+        # the suffix before comparing with what the browser sends back
+        sent = {tag.split(":")[0] for tag in request.if_none_match.as_set(include_weak=True)}
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        if etag in sent:
+            response.status_code = 304
+            response.set_data(b"")
+    return response
+
+
 # App Layout
 app.layout = html.Div(
     style={
@@ -155,12 +220,11 @@ app.layout = html.Div(
      Input("date-picker", "end_date")]
 )
 def update_dashboard(selected_sector, start_date, end_date):
-    # Filter data based on selections
-    filtered_df = merged_df[
-        (merged_df["sector"] == selected_sector) &
-        (merged_df["date"] >= pd.to_datetime(start_date)) &
-        (merged_df["date"] <= pd.to_datetime(end_date))
-    ].sort_values("date")
+    # Filter data based on selections (dates are sorted, so slice by position)
+    sector_df = sector_frames.get(selected_sector, merged_df.iloc[0:0])
+    start = sector_df["date"].searchsorted(pd.to_datetime(start_date), side="left")
+    end = sector_df["date"].searchsorted(pd.to_datetime(end_date), side="right")
+    filtered_df = sector_df.iloc[start:end]
     
     # Create figure with secondary y-axis
     fig = go.Figure()
@@ -249,7 +313,8 @@ def create_stat_card(label, value):
 
 # Run the app
 if __name__ == "__main__":
+    # Local development only; in production run `gunicorn app:server`,
+    # which picks up the worker settings in gunicorn.conf.py
     # Get port from environment variable (Render sets this automatically)
     port = int(os.environ.get("PORT", 8050))
-    # Run in production mode
-    app.run(debug=False, host="0.0.0.0", port=port)
\ No newline at end of file
+    app.run(debug=False, host="0.0.0.0", port=port, threaded=True)
\ No newline at end of file
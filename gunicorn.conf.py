@@ -0,0 +1,31 @@
+"""
+Gunicorn settings for serving the dashboard in production
+File: gunicorn.conf.py
+
+Gunicorn reads this file automatically from the working directory:
+    gunicorn app:server
+
+update_dashboard is CPU-bound (pandas slicing + Plotly JSON), so extra
+processes add throughput while threads mainly overlap socket I/O and
+compression. Async workers (gevent/eventlet) don't help CPU-bound callbacks.
+Tune WEB_CONCURRENCY / GUNICORN_THREADS with load_test.py.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8050)}"
+
+# One process per CPU core on a small Render instance, a few threads each
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+# Load the CSVs once in the master; workers share the pages copy-on-write
+preload_app = True
+
+timeout = 60
+keepalive = 5
+
+# Recycle workers now and then to cap memory growth
+max_requests = 1000
+max_requests_jitter = 100
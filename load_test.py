@@ -0,0 +1,187 @@
+"""
+Concurrency Load Test for the Dashboard
+File: load_test.py
+
+Replays update_dashboard callback traffic (sector switches and date range
+drags) against a running instance with a pool of virtual users, then
+reports p50/p95/p99 latency and throughput. Uses only the standard library
+and talks to a local server, so it works offline.
+
+Usage:
+    gunicorn app:server                      # or: python app.py
+    python load_test.py --users 1,4,8,16 --duration 20
+"""
+
+import json
+import time
+import random
+import argparse
+import statistics
+import threading
+import urllib.request
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_URL = "http://127.0.0.1:8050"
+
+# Share of actions that switch sector; the rest drag the date range
+SECTOR_SWITCH_RATIO = 0.4
+
+
+def callback_payload(sector, start_date, end_date, changed="sector-dropdown.value"):
+    """Build the JSON body the browser posts to _dash-update-component"""
+    return {
+        "output": "..candlestick-chart.figure...stats-section.children..",
+        "outputs": [
+            {"id": "candlestick-chart", "property": "figure"},
+            {"id": "stats-section", "property": "children"},
+        ],
+        "inputs": [
+            {"id": "sector-dropdown", "property": "value", "value": sector},
+            {"id": "date-picker", "property": "start_date", "value": start_date},
+            {"id": "date-picker", "property": "end_date", "value": end_date},
+        ],
+        "changedPropIds": [changed],
+        "state": [],
+    }
+
+
+def find_component(node, component_id):
+    """Search the _dash-layout JSON tree for a component by id"""
+    if isinstance(node, list):
+        for child in node:
+            found = find_component(child, component_id)
+            if found:
+                return found
+    elif isinstance(node, dict):
+        props = node.get("props", {})
+        if props.get("id") == component_id:
+            return props
+        return find_component(props.get("children"), component_id)
+    return None
+
+
+def get_dashboard_options(base_url):
+    """Read the sector list and date bounds from the running app's layout"""
+    with urllib.request.urlopen(f"{base_url}/_dash-layout") as response:
+        layout = json.load(response)
+    dropdown = find_component(layout, "sector-dropdown")
+    picker = find_component(layout, "date-picker")
+    sectors = [option["value"] for option in dropdown["options"]]
+    min_date = date.fromisoformat(picker["min_date_allowed"][:10])
+    max_date = date.fromisoformat(picker["max_date_allowed"][:10])
+    return sectors, min_date, max_date
+
+
+def next_action(rng, state, sectors, min_date, max_date):
+    """Pick the next user action and update the user's current view"""
+    if rng.random() < SECTOR_SWITCH_RATIO:
+        state["sector"] = rng.choice(sectors)
+        changed = "sector-dropdown.value"
+    else:
+        # Drag one end of the range, keeping at least a month selected
+        span = (max_date - min_date).days
+        start = min_date + timedelta(days=rng.randint(0, span - 30))
+        end = start + timedelta(days=rng.randint(30, (max_date - start).days))
+        state["start"], state["end"] = start, end
+        changed = rng.choice(["date-picker.start_date", "date-picker.end_date"])
+    return callback_payload(state["sector"], state["start"].isoformat(), state["end"].isoformat(), changed)
+
+
+def virtual_user(base_url, user_id, deadline, think_time, options, results, lock):
+    """Fire callbacks back-to-back (plus optional think time) until the deadline"""
+    sectors, min_date, max_date = options
+    rng = random.Random(user_id)
+    state = {"sector": sectors[0], "start": min_date, "end": max_date}
+    url = f"{base_url}/_dash-update-component"
+    latencies, errors = [], 0
+
+    while time.perf_counter() < deadline:
+        body = json.dumps(next_action(rng, state, sectors, min_date, max_date)).encode()
+        request = urllib.request.Request(
+            url,
+            data=body,
+            headers={"Content-Type": "application/json", "Accept-Encoding": "br, gzip"},
+        )
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                response.read()
+            latencies.append((time.perf_counter() - start) * 1000)
+        except Exception:
+            errors += 1
+        if think_time:
+            time.sleep(rng.uniform(0, 2 * think_time))
+
+    with lock:
+        results["latencies"].extend(latencies)
+        results["errors"] += errors
+
+
+def run_load(base_url, users, duration, think_time, options):
+    """Run one load level and return its latency and throughput summary"""
+    results = {"latencies": [], "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        for user_id in range(users):
+            pool.submit(virtual_user, base_url, user_id, deadline, think_time, options, results, lock)
+
+    latencies = results["latencies"]
+    if len(latencies) < 2:
+        return {"users": users, "requests": len(latencies), "errors": results["errors"]}
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "users": users,
+        "requests": len(latencies),
+        "errors": results["errors"],
+        "throughput": len(latencies) / duration,
+        "p50": cuts[49],
+        "p95": cuts[94],
+        "p99": cuts[98],
+    }
+
+
+def print_report(rows):
+    print(f"\n{'Users':>6} {'Requests':>9} {'Errors':>7} {'Req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    print("-" * 60)
+    for row in rows:
+        if "p50" not in row:
+            print(f"{row['users']:>6} {row['requests']:>9} {row['errors']:>7}   (not enough successful requests)")
+            continue
+        print(
+            f"{row['users']:>6} {row['requests']:>9} {row['errors']:>7} {row['throughput']:>8.1f} "
+            f"{row['p50']:>8.0f} {row['p95']:>8.0f} {row['p99']:>8.0f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=DEFAULT_URL, help="base URL of the running dashboard")
+    parser.add_argument("--users", default="1,4,8,16", help="comma-separated concurrent user counts")
+    parser.add_argument("--duration", type=float, default=20, help="seconds per load level")
+    parser.add_argument("--warmup", type=float, default=3, help="seconds of warm-up traffic before measuring")
+    parser.add_argument("--think-time", type=float, default=0, help="mean pause between actions in seconds")
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip("/")
+    options = get_dashboard_options(base_url)
+    levels = [int(users) for users in args.users.split(",")]
+
+    print("=" * 60)
+    print(f"🚦 Load testing {base_url}")
+    print(f"   {len(options[0])} sectors, {options[1]} → {options[2]}")
+    print("=" * 60)
+
+    if args.warmup:
+        run_load(base_url, max(levels), args.warmup, args.think_time, options)
+
+    rows = []
+    for users in levels:
+        print(f"⏳ {users} concurrent user(s) for {args.duration:.0f}s...")
+        rows.append(run_load(base_url, users, args.duration, args.think_time, options))
+    print_report(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Transfer Size & Page Load Measurement for the Dashboard
+File: measure_transfer.py
+
+Loads the full-range view (index page, Dash bundles, layout and the first
+update_dashboard callback) through Flask's test client, with and without
+compression, then replays it as a repeat visit with a warm browser cache.
+Load times are estimated for a throttled connection from the measured sizes
+and server times, so no network access or running server is needed.
+
+Usage:
+    python measure_transfer.py [--kbps 1600] [--rtt 150]
+"""
+
+import re
+import time
+import argparse
+from app import server, sectors, merged_df
+from load_test import callback_payload
+
+# Chrome DevTools "Fast 3G" preset
+DEFAULT_KBPS = 1600
+DEFAULT_RTT_MS = 150
+
+SCRIPT_RE = re.compile(r'<(?:script|link)[^>]+(?:src|href)="([^"]+)"')
+
+
+def fetch(client, method, url, headers, cache, **kwargs):
+    """Request a URL, honouring cached ETags / immutable entries like a browser"""
+    headers = dict(headers)
+    cached = cache.get(url)
+    if cached and "immutable" in cached.get("Cache-Control", ""):
+        return {"url": url, "status": "cache", "bytes": 0, "server_ms": 0.0}
+    if cached and cached.get("ETag"):
+        headers["If-None-Match"] = cached["ETag"]
+
+    start = time.perf_counter()
+    response = getattr(client, method)(url, headers=headers, **kwargs)
+    body = response.get_data()
+    server_ms = (time.perf_counter() - start) * 1000
+
+    if response.status_code == 200 and method == "get":
+        cache[url] = response.headers
+    return {
+        "url": url,
+        "status": response.status_code,
+        "bytes": len(body) + sum(len(k) + len(v) + 4 for k, v in response.headers.items()),
+        "server_ms": server_ms,
+        "encoding": response.headers.get("Content-Encoding", "identity"),
+    }
+
+
+def load_page(client, accept_encoding, cache):
+    """Fetch everything the browser needs to render the full-range view, in phases"""
+    headers = {"Accept-Encoding": accept_encoding}
+    index = fetch(client, "get", "/", headers, cache)
+    # Parse bundle URLs from an uncompressed copy of the index page
+    html_text = client.get("/").get_data(as_text=True)
+    bundles = [fetch(client, "get", url, headers, cache) for url in SCRIPT_RE.findall(html_text)]
+    layout = [
+        fetch(client, "get", "/_dash-layout", headers, cache),
+        fetch(client, "get", "/_dash-dependencies", headers, cache),
+    ]
+    start_date = merged_df["date"].min().strftime("%Y-%m-%d")
+    end_date = merged_df["date"].max().strftime("%Y-%m-%d")
+    update = fetch(
+        client, "post", "/_dash-update-component", headers, {},
+        json=callback_payload(sectors[0], start_date, end_date),
+    )
+    return [[index], bundles, layout, [update]]
+
+
+def estimate_load_ms(phases, kbps, rtt_ms):
+    """Each phase costs one round trip plus its bytes at the throttled bandwidth"""
+    total = 0.0
+    for phase in phases:
+        fetched = [r for r in phase if r["status"] != "cache"]
+        if not fetched:
+            continue
+        transfer_ms = sum(r["bytes"] for r in fetched) * 8 / kbps
+        total += rtt_ms + transfer_ms + max(r["server_ms"] for r in fetched)
+    return total
+
+
+def report(label, phases, kbps, rtt_ms):
+    requests_ = [r for phase in phases for r in phase]
+    total_bytes = sum(r["bytes"] for r in requests_)
+    update = phases[-1][0]
+    not_modified = sum(1 for r in requests_ if r["status"] == 304)
+    from_cache = sum(1 for r in requests_ if r["status"] == "cache")
+    print(f"\n📦 {label}")
+    print(f"   Requests: {len(requests_)} ({not_modified} × 304, {from_cache} from cache)")
+    print(f"   Bytes transferred: {total_bytes / 1024:.1f} KiB")
+    print(f"   Callback response: {update['bytes'] / 1024:.1f} KiB ({update['encoding']})")
+    print(f"   Est. load time @ {kbps} kbps / {rtt_ms} ms RTT: {estimate_load_ms(phases, kbps, rtt_ms):.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kbps", type=int, default=DEFAULT_KBPS, help="throttled bandwidth in kbit/s")
+    parser.add_argument("--rtt", type=int, default=DEFAULT_RTT_MS, help="round-trip time in ms")
+    args = parser.parse_args()
+
+    client = server.test_client()
+    print("=" * 60)
+    print(f"📊 Full-range view of '{sectors[0]}'")
+    print("=" * 60)
+
+    report("Uncompressed, cold cache", load_page(client, "identity", {}), args.kbps, args.rtt)
+    report("gzip, cold cache", load_page(client, "gzip", {}), args.kbps, args.rtt)
+
+    cache = {}
+    report("Brotli, cold cache", load_page(client, "br, gzip", cache), args.kbps, args.rtt)
+    report("Brotli, repeat visit", load_page(client, "br, gzip", cache), args.kbps, args.rtt)
+
+
+if __name__ == "__main__":
+    main()